@@ -5,6 +5,7 @@ This is an alternative to the turtle-based simulation that doesn't rely on tkint
 import math
 import random
 import sys
+from collections import deque
 
 try:
     import pygame
@@ -13,14 +14,25 @@ except ImportError:
     print("pip install pygame")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional - without NumPy gravity is computed with plain Python loops
+
 # Initialize pygame
 pygame.init()
 
 # Screen setup
 WIDTH, HEIGHT = 1400, 900
+CX, CY = WIDTH // 2, HEIGHT // 2  # Screen position of the simulation origin
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Solar System Simulation")
 
+# Only queue the events the main loop handles, so mouse motion and window
+# events aren't turned into Event objects just to be skipped
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN])
+
 # Global time factor to control simulation speed
 TIME_SCALE = 0.25  # Lower values = slower simulation
 
@@ -31,6 +43,62 @@ GRAVITY_STRENGTH = 0.5  # Reduced from implicit 1.0
 DISTANCE_DAMPING = 10.0  # Higher value reduces gravitational force at close distances
 ORBIT_CORRECTION = 0.02  # Increased from 0.01 for better stability
 
+# Barnes-Hut approximation for large numbers of bodies
+BARNES_HUT_THETA = 0.5  # Opening angle - lower values are more accurate but slower
+BARNES_HUT_MIN_BODIES = 64  # Below this many bodies exerting gravity direct pairwise gravity is faster
+
+# Vectorized gravity when NumPy is installed
+ARRAY_GRAVITY_MAX_BODIES = 1024  # Above this the pair arrays can use too much memory, so Barnes-Hut is used
+
+# Number of recent positions kept for each body's trail
+MAX_TRAIL_LENGTH = 50
+
+# Upper limit on asteroids - adding one more replaces the oldest, so frame time stays bounded
+MAX_ASTEROIDS = 1000
+
+# Body kinds - compared as plain ints instead of isinstance() checks in the hot loops
+KIND_BODY = 0
+KIND_SUN = 1
+KIND_PLANET = 2
+KIND_ASTEROID = 3
+KIND_NAMES = ("Body", "Sun", "Planet", "Asteroid")  # Display names indexed by kind
+
+# Alien physics modes, in the order they cycle through, the color each is shown in
+# and the mode that follows each one
+PHYSICS_MODE_DURATION = 10  # Seconds each alien physics mode lasts
+PHYSICS_MODE_NAMES = (
+    "Magnetic Ballet",
+    "Orbital Waltz",
+    "Vibration Samba",
+    "Quantum Tango",
+    "Choreographed Orbits",
+    "Spiral Dance",
+    "Rhythmic Pulsation",
+)
+PHYSICS_MODE_COLORS = (
+    (255, 100, 100),  # Red for magnetic ballet
+    (100, 255, 100),  # Green for orbital waltz
+    (100, 100, 255),  # Blue for vibration samba
+    (255, 255, 100),  # Yellow for quantum tango
+    (255, 100, 255),  # Magenta for choreographed orbits
+    (255, 100, 100),  # Red for spiral dance
+    (100, 100, 255),  # Blue for rhythmic pulsation
+)
+NEXT_PHYSICS_MODES = (
+    1,  # Magnetic ballet is followed by orbital waltz
+    2,  # Orbital waltz by vibration samba
+    3,  # Vibration samba by quantum tango
+    4,  # Quantum tango by choreographed orbits
+    5,  # Choreographed orbits by spiral dance
+    6,  # Spiral dance by rhythmic pulsation
+    0,  # Rhythmic pulsation wraps round to magnetic ballet
+)
+
+# HUD status lines, indexed by whether the setting is on (False = 0, True = 1)
+ENFORCE_CIRCULAR_ORBIT_TEXTS = ("Circular Orbit Enforcement: Off", "Circular Orbit Enforcement: On")
+TRAILS_TEXTS = ("Orbit Trails: Off", "Orbit Trails: On")
+ALIEN_PHYSICS_TEXTS = ("Alien Physics: Off", "Alien Physics: On")
+
 # Define colors with alpha channel
 BLACK = (0, 0, 0, 255)  # Fully opaque black
 YELLOW = (255, 255, 0, 128)  # Semi-transparent yellow
@@ -113,54 +181,99 @@ def generate_random_asteroid_name():
     
     return name
 
+def render_translucent_text(font, text, color):
+    """Render text as a semi-transparent surface."""
+    # Scale the rendered text's own per-pixel alpha down to half (128 = semi-transparent)
+    # rather than wrapping it in a second surface with a surface alpha, so blitting it
+    # takes the plain per-pixel alpha path
+    text_surface = font.render(text, True, color)
+    text_surface.fill((255, 255, 255, 128), special_flags=pygame.BLEND_RGBA_MULT)
+    return text_surface.convert_alpha()
+
+# Semi-transparent text surfaces made by render_label(), keyed by (font, text, color).
+# Nothing is ever dropped, so render_label() is only for labels from a fixed set of strings
+label_cache = {}
+
+def render_label(font, text, color):
+    """Return text rendered onto a semi-transparent surface, rendering each distinct label only once."""
+    key = (font, text, color)
+    label_surface = label_cache.get(key)
+    if label_surface is None:
+        label_surface = render_translucent_text(font, text, color)
+        label_cache[key] = label_surface
+    return label_surface
+
 class Body:
     """Base class for all celestial bodies."""
+    kind = KIND_BODY  # Overridden by each subclass
+    exerts_gravity = True  # Whether other bodies are pulled towards this one (or moved by it in alien physics)
     min_display_size = 5  # Smaller minimum size
     display_log_base = 1.5  # Increased log base for more size difference
+    display_log_divisor = math.log(display_log_base)  # Natural log of the base, computed once
     
     def __init__(self, mass, position=(0, 0), velocity=(0, 0), color=WHITE):
         self.mass = mass
-        self.position = position  # (x, y)
-        self.velocity = velocity  # (vx, vy)
+        # Position and velocity are kept as separate floats so the physics loops
+        # can update them in place instead of building new tuples every step
+        self.x, self.y = position
+        self.vx, self.vy = velocity
         self.color = color
         self.display_size = max(
-            int(math.log(self.mass, self.display_log_base)),
+            int(math.log(self.mass) / self.display_log_divisor),
             self.min_display_size,
         )
     
+    @property
+    def position(self):
+        """Position as an (x, y) tuple."""
+        return (self.x, self.y)
+    
+    @position.setter
+    def position(self, position):
+        self.x, self.y = position
+    
+    @property
+    def velocity(self):
+        """Velocity as a (vx, vy) tuple."""
+        return (self.vx, self.vy)
+    
+    @velocity.setter
+    def velocity(self, velocity):
+        self.vx, self.vy = velocity
+    
     def move(self):
         """Update position based on velocity, using the global time scale."""
-        x, y = self.position
-        vx, vy = self.velocity
         # Apply time scale to velocity
-        self.position = (x + vx * TIME_SCALE, y + vy * TIME_SCALE)
+        self.x += self.vx * TIME_SCALE
+        self.y += self.vy * TIME_SCALE
+    
+    def screen_position(self):
+        """Return the body's position in integer screen coordinates."""
+        return int(self.x + CX), int(self.y + CY)
     
-    def draw(self, surface):
-        """Draw the body on the given surface."""
-        x, y = self.position
-        screen_x = int(x + WIDTH // 2)
-        screen_y = int(y + HEIGHT // 2)
+    def draw(self, surface, screen_pos=None):
+        """Draw the body on the given surface.
+        
+        screen_pos is the body's screen_position() if the caller already has it.
+        """
+        screen_x, screen_y = screen_pos or self.screen_position()
         pygame.draw.circle(surface, self.color, (screen_x, screen_y), self.display_size)
     
     def distance_to(self, other):
         """Calculate distance to another body."""
-        x1, y1 = self.position
-        x2, y2 = other.position
-        return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-    
-    def angle_to(self, other):
-        """Calculate angle to another body in radians."""
-        x1, y1 = self.position
-        x2, y2 = other.position
-        return math.atan2(y2 - y1, x2 - x1)
+        return math.hypot(other.x - self.x, other.y - self.y)
 
 class Sun(Body):
     """A sun in the solar system."""
+    kind = KIND_SUN
+    
     def __init__(self, mass, position=(0, 0), velocity=(0, 0)):
         super().__init__(mass, position, velocity, YELLOW)
 
 class Planet(Body):
     """A planet in the solar system."""
+    kind = KIND_PLANET
+    
     def __init__(self, mass, position=(0, 0), velocity=(0, 0), color=None, has_rings=False):
         if color is None:
             color = random.choice(PLANET_COLORS)
@@ -168,11 +281,9 @@ class Planet(Body):
         self.has_rings = has_rings
         self.ring_color = (200, 200, 170)  # Light gray for rings
     
-    def draw(self, surface):
+    def draw(self, surface, screen_pos=None):
         """Draw the planet and its rings if it has any."""
-        x, y = self.position
-        screen_x = int(x + WIDTH // 2)
-        screen_y = int(y + HEIGHT // 2)
+        screen_x, screen_y = screen_pos or self.screen_position()
         
         # Draw the planet
         pygame.draw.circle(surface, self.color, (screen_x, screen_y), self.display_size)
@@ -203,6 +314,9 @@ class Planet(Body):
 
 class Asteroid(Body):
     """An asteroid in the solar system."""
+    kind = KIND_ASTEROID
+    exerts_gravity = False  # Asteroids are light enough to act as test particles - pulled but not pulling
+    
     def __init__(self, mass, position=(0, 0), velocity=(0, 0), eccentricity=0.3):
         """Initialize an asteroid with given properties and random color variation."""
         # Create subtle color variation for asteroids
@@ -215,125 +329,297 @@ class Asteroid(Body):
         super().__init__(mass, position, velocity, color)
         self.eccentricity = eccentricity  # Orbit eccentricity (0 = circular, higher = more elliptical)
         
-    def draw(self, surface):
+        # Irregular outline as unit vectors from the center - a rough pentagon whose corners
+        # are jittered once here, so drawing needs no trigonometry and the shape doesn't flicker
+        self.outline = []
+        for i in range(5):
+            angle = 2 * math.pi * i / 5 + random.uniform(-0.2, 0.2)
+            self.outline.append((math.cos(angle), math.sin(angle)))
+
+        self.sprite = None  # Pre-drawn image of the asteroid, created by get_sprite()
+    
+    def draw(self, surface, screen_pos=None):
         """Draw the asteroid as a small irregular shape."""
-        x, y = self.position
-        screen_x = int(x + WIDTH // 2)
-        screen_y = int(y + HEIGHT // 2)
+        screen_x, screen_y = screen_pos or self.screen_position()
         
         # Draw a small dot for the asteroid
         pygame.draw.circle(surface, self.color, (screen_x, screen_y), self.display_size)
         
         # Add a small irregular shape to make it look more like an asteroid
         # Rather than a perfect circle
-        points = []
-        for i in range(5):  # Create a rough pentagon
-            angle = 2 * math.pi * i / 5 + random.uniform(-0.2, 0.2)
-            point_x = screen_x + math.cos(angle) * (self.display_size - 1)
-            point_y = screen_y + math.sin(angle) * (self.display_size - 1)
-            points.append((point_x, point_y))
+        radius = self.display_size - 1
+        points = [(screen_x + dx * radius, screen_y + dy * radius) for dx, dy in self.outline]
         
         # Draw the irregular shape
         if len(points) >= 3:  # Need at least 3 points for a polygon
             pygame.draw.polygon(surface, self.color, points)
+    
+    def get_sprite(self):
+        """Return the asteroid drawn once onto a small surface, centered at (display_size, display_size).
+        
+        Asteroids never change shape or size, so blitting this gives the same pixels as draw().
+        """
+        if self.sprite is None:
+            size = self.display_size
+            self.sprite = pygame.Surface((2 * size + 1, 2 * size + 1))
+            self.sprite.set_colorkey(BLACK)
+            self.draw(self.sprite, (size, size))
+        return self.sprite
+
+class QuadTreeNode:
+    """A square region of space used for the Barnes-Hut gravity approximation."""
+    max_depth = 32  # Stop subdividing so bodies at almost the same spot share a leaf
+    
+    def __init__(self, cx, cy, half_width, depth=0):
+        self.cx = cx  # Center of the square
+        self.cy = cy
+        self.half_width = half_width
+        self.depth = depth
+        self.total_mass = 0.0
+        self.com_x = 0.0  # Center of mass of everything inside the node
+        self.com_y = 0.0
+        self.children = None  # Four sub-quadrants once the node has been split
+        self.bodies = []  # Bodies stored directly in a leaf
+    
+    @classmethod
+    def build(cls, bodies):
+        """Build a quadtree containing all the given bodies."""
+        xs = [body.x for body in bodies]
+        ys = [body.y for body in bodies]
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        
+        # Square root node covering the bounding box, padded so no body sits on the edge
+        half_width = max(max_x - min_x, max_y - min_y) / 2 + 1
+        root = cls((min_x + max_x) / 2, (min_y + max_y) / 2, half_width)
+        for body in bodies:
+            root.insert(body)
+        return root
+    
+    def insert(self, body):
+        """Insert a body, splitting the node if it is an occupied leaf."""
+        x, y = body.x, body.y
+        
+        # Accumulate total mass and mass-weighted center of mass
+        new_mass = self.total_mass + body.mass
+        self.com_x = (self.com_x * self.total_mass + x * body.mass) / new_mass
+        self.com_y = (self.com_y * self.total_mass + y * body.mass) / new_mass
+        self.total_mass = new_mass
+        
+        if self.children is None:
+            if not self.bodies or self.depth >= self.max_depth:
+                self.bodies.append(body)
+                return
+            
+            # Leaf is already occupied - split it and push the existing bodies down
+            quarter = self.half_width / 2
+            self.children = [
+                QuadTreeNode(self.cx - quarter, self.cy - quarter, quarter, self.depth + 1),
+                QuadTreeNode(self.cx + quarter, self.cy - quarter, quarter, self.depth + 1),
+                QuadTreeNode(self.cx - quarter, self.cy + quarter, quarter, self.depth + 1),
+                QuadTreeNode(self.cx + quarter, self.cy + quarter, quarter, self.depth + 1)
+            ]
+            for existing in self.bodies:
+                self.child_for(existing).insert(existing)
+            self.bodies = []
+        
+        self.child_for(body).insert(body)
+    
+    def child_for(self, body):
+        """Return the sub-quadrant that contains the body."""
+        return self.children[(body.x >= self.cx) + 2 * (body.y >= self.cy)]
+    
+    def contains(self, body):
+        """Check whether the body lies inside this node's square."""
+        return abs(body.x - self.cx) <= self.half_width and abs(body.y - self.cy) <= self.half_width
+    
+    def acceleration_on(self, body, theta):
+        """Return the (ax, ay) gravitational acceleration this node exerts on a body."""
+        x, y = body.x, body.y
+        
+        if self.children is None:
+            # Leaf - interact with each stored body directly
+            ax = ay = 0.0
+            for other in self.bodies:
+                if other is not body:
+                    dx = other.x - x
+                    dy = other.y - y
+                    acc_x, acc_y = gravity_acceleration(other.mass, dx, dy)
+                    ax += acc_x
+                    ay += acc_y
+            return ax, ay
+        
+        dx = self.com_x - x
+        dy = self.com_y - y
+        
+        # Far enough away (width / distance < theta) - treat the node as a single pseudo-body.
+        # A node containing the body itself is always opened so it never attracts itself.
+        size = self.half_width * 2
+        if size * size < theta * theta * (dx*dx + dy*dy) and not self.contains(body):
+            return gravity_acceleration(self.total_mass, dx, dy)
+        
+        # Too close - recurse into the children
+        ax = ay = 0.0
+        for child in self.children:
+            if child.total_mass > 0:
+                acc_x, acc_y = child.acceleration_on(body, theta)
+                ax += acc_x
+                ay += acc_y
+        return ax, ay
+    
+    def bodies_near(self, x, y, radius, found):
+        """Append to found every body in a leaf that may lie within radius of (x, y)."""
+        # Skip nodes whose square doesn't reach the search area
+        reach = self.half_width + radius
+        if abs(x - self.cx) > reach or abs(y - self.cy) > reach:
+            return
+        
+        if self.children is None:
+            found.extend(self.bodies)
+        else:
+            for child in self.children:
+                if child.total_mass > 0:
+                    child.bodies_near(x, y, radius, found)
+
+def gravity_acceleration(mass, dx, dy):
+    """Return the Newtonian acceleration towards a mass at offset (dx, dy)."""
+    distance = math.sqrt(dx*dx + dy*dy)
+    # Skip if the bodies are too close to avoid division by zero
+    if distance < 1:
+        return 0.0, 0.0
+    
+    acc = GRAVITY_STRENGTH * mass / (distance * distance + DISTANCE_DAMPING)
+    # Limit maximum acceleration for numerical stability (same limit as calculate_gravity)
+    acc = min(acc, 0.5)
+    # Unit vector (dx / distance, dy / distance) gives the direction without trigonometry
+    return acc * dx / distance, acc * dy / distance
+
+def pair_offset(first, second):
+    """Return (dx, dy, distance) from the first body to the second."""
+    dx = second.x - first.x
+    dy = second.y - first.y
+    return dx, dy, math.sqrt(dx*dx + dy*dy)
 
 class SolarSystem:
     """Manages all the bodies in the solar system and their interactions."""
     def __init__(self):
         self.bodies = []
+        self.sun = None  # The (first) sun, cached so it never has to be searched for
+        self.planets = []  # Just the planets, for loops that don't concern other bodies
+        self.asteroids = deque()  # Just the asteroids, oldest first, for the MAX_ASTEROIDS limit
+        # Bodies destroyed during the current step, removed together at its end - a dict kept in
+        # the order they were destroyed (so they are logged in that order), mapping each body
+        # to how its removal is logged
+        self.destroyed = {}
         self.planet_names = {}  # Dictionary to store planet names
+        self.name_font = pygame.font.SysFont('Arial', 12)  # Small font for the planet names
+        self.name_labels = {}  # Rendered name label surfaces, created once per body
         self.show_orbits = True  # Flag to show orbit paths
         self.show_trails = True  # Flag to show celestial body trails
         self.body_trails = {}  # Dictionary to store body trail points
         self.initial_distances = {}  # Store initial distances from sun for enforcing circular orbits
+        self.orbit_radii = {}  # Initial distances of planets as whole pixels, for drawing their orbits
         self.enforce_circular_orbit_enabled = True  # Flag to toggle enforcing circular orbits
         self.alien_physics_enabled = False  # Flag to toggle alien physics mode
         self.current_physics_mode = 0  # Track the current physics mode for oscillation
+        self.physics_ticks = 0  # pygame.time.get_ticks() at the start of the current alien physics step
+        self.alien_accelerations = {}  # Per-body accelerations for this step, see alien_body_acceleration
         self.message_log = []  # List to store game messages for display
+        self.message_labels = {}  # Rendered message surfaces keyed by (message, color), while in the log
         self.max_log_messages = 5  # Maximum number of messages to display at once
     
     def add_body(self, body, name=None):
         """Add a body to the solar system."""
         self.bodies.append(body)
+        if body.kind == KIND_SUN and self.sun is None:
+            self.sun = body
+        elif body.kind == KIND_PLANET:
+            self.planets.append(body)
+        elif body.kind == KIND_ASTEROID:
+            self.asteroids.append(body)
         if name:
             self.planet_names[body] = name
             # Initialize empty trail for the planet or asteroid
-            if isinstance(body, Planet) or isinstance(body, Asteroid):
-                self.body_trails[body] = []
+            if body.kind == KIND_PLANET or body.kind == KIND_ASTEROID:
+                # A bounded deque drops the oldest point itself, without copying the trail
+                self.body_trails[body] = deque(maxlen=MAX_TRAIL_LENGTH)
                 
                 # Store initial distance from sun for enforcing circular orbits
-                sun = None
-                for b in self.bodies:
-                    if isinstance(b, Sun):
-                        sun = b
-                        break
-                
+                sun = self.sun
                 if sun:
                     distance = body.distance_to(sun)
                     self.initial_distances[body] = distance
+                    if body.kind == KIND_PLANET:
+                        self.orbit_radii[body] = int(distance)
     
-    def remove_body(self, body):
-        """Remove a body from the solar system."""
+    def remove_body(self, body, reason="destroyed"):
+        """Remove a body from the solar system, logging that it was destroyed (or the given reason)."""
         # Check if body is still in the list before attempting to remove
         if body not in self.bodies:
             return
             
-        # Get the body name if it exists
-        name = self.planet_names.get(body, "unnamed")
+        self.destroy_body(body, reason)
+        self.remove_destroyed_bodies()
         
-        # Log removal with appropriate body type
-        body_type = "Body"
-        if isinstance(body, Sun): body_type = "Sun"
-        elif isinstance(body, Planet): body_type = "Planet"
-        elif isinstance(body, Asteroid): body_type = "Asteroid"
+    def destroy_body(self, body, reason="destroyed"):
+        """Mark a body as destroyed; it is removed by the next remove_destroyed_bodies()."""
+        self.destroyed[body] = reason
         
-        # Print log message 
-        print(f"{body_type} {name} was destroyed!")
+    def remove_destroyed_bodies(self):
+        """Remove all bodies destroyed during the current step in a single pass."""
+        if not self.destroyed:
+            return
         
-        # Remove from planet names dictionary
-        if body in self.planet_names:
-            self.planet_names.pop(body)
+        for body, reason in self.destroyed.items():
+            # Get the body name if it exists
+            name = self.planet_names.get(body, "unnamed")
+            
+            # Log removal with appropriate body type
+            body_type = KIND_NAMES[body.kind]
             
-        # Remove from trails dictionary
-        if body in self.body_trails:
-            self.body_trails.pop(body)
+            # Print log message 
+            print(f"{body_type} {name} was {reason}!")
+            
+            # Remove from planet names dictionary
+            self.planet_names.pop(body, None)
+            self.name_labels.pop(body, None)
+
+            # Remove from trails dictionary
+            self.body_trails.pop(body, None)
             
-        # Remove from initial distances dictionary
-        if body in self.initial_distances:
-            self.initial_distances.pop(body)
+            # Remove from initial distances dictionary
+            self.initial_distances.pop(body, None)
+            self.orbit_radii.pop(body, None)
             
-        # Only call clear() if it's available (SolarSystemBody class from turtle)
-        if hasattr(body, 'clear'):
-            body.clear()
+            # Only call clear() if it's available (SolarSystemBody class from turtle)
+            if hasattr(body, 'clear'):
+                body.clear()
         
-        self.bodies.remove(body)
+        # Rebuild the list once instead of an O(N) list.remove() per destroyed body
+        destroyed = self.destroyed
+        self.bodies = [body for body in self.bodies if body not in destroyed]
+        self.planets = [planet for planet in self.planets if planet not in destroyed]
+        self.asteroids = deque(asteroid for asteroid in self.asteroids if asteroid not in destroyed)
+
+        # Fall back to the next sun, if there is one
+        if self.sun in destroyed:
+            self.sun = next((b for b in self.bodies if b.kind == KIND_SUN), None)
+        
+        self.destroyed = {}
     
     def update_all(self, surface):
         """Update and draw all bodies."""
         # Draw orbit circles first (if enabled)
         if self.show_orbits:
-            # Find the sun to center orbits
-            sun_pos = (0, 0)
-            for body in self.bodies:
-                if isinstance(body, Sun):
-                    sun_pos = body.position
-                    break
+            # Center orbits on the sun
+            sun_screen_x, sun_screen_y = self.sun.screen_position() if self.sun else (CX, CY)
             
-            sun_screen_x = int(sun_pos[0] + WIDTH // 2)
-            sun_screen_y = int(sun_pos[1] + HEIGHT // 2)
-            
-            # Draw orbit circles for each planet
-            for body in self.bodies:
-                if isinstance(body, Planet):
-                    # Calculate distance from sun to planet
-                    dx = body.position[0] - sun_pos[0]
-                    dy = body.position[1] - sun_pos[1]
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    # Draw orbit circle (very thin, light gray)
-                    orbit_color = (50, 50, 50)  # Dark gray
-                    pygame.draw.circle(surface, orbit_color, (sun_screen_x, sun_screen_y), 
-                                      int(distance), 1)
+            # Draw orbit circles (very thin, light gray) at the distance each planet was created at,
+            # which circular orbit enforcement keeps it on - planets sharing an orbit only need
+            # their circle drawn once
+            orbit_color = (50, 50, 50)  # Dark gray
+            for radius in set(self.orbit_radii.values()):
+                pygame.draw.circle(surface, orbit_color, (sun_screen_x, sun_screen_y), radius, 1)
         
         # Draw trails for celestial bodies first (so they appear behind the bodies)
         if self.show_trails:
@@ -344,98 +630,172 @@ class SolarSystem:
                     # Draw lines connecting trail points
                     pygame.draw.lines(surface, trail_color, False, trail_points, 1)
         
+        # Asteroid sprites and name labels are blitted in batches with surface.blits() - the
+        # pending batch is drawn before each planet or sun, so bodies are still painted in list order
+        pending_blits = []
+        
         # Update and draw all bodies
         for body in self.bodies:
-            # Update position
+            # Update position using the velocity handle_all_interactions just updated -
+            # kick then drift is semi-implicit (symplectic) Euler, i.e. leapfrog, so the
+            # integrator itself does not make orbits gain or lose energy over time
             body.move()
             
-            # Record trail for bodies
-            if body in self.body_trails:
-                # Add current position to trail
-                x, y = body.position
-                screen_x = int(x + WIDTH // 2)
-                screen_y = int(y + HEIGHT // 2)
-                self.body_trails[body].append((screen_x, screen_y))
-                
-                # Limit trail length
-                max_trail_length = 50
-                if len(self.body_trails[body]) > max_trail_length:
-                    self.body_trails[body] = self.body_trails[body][-max_trail_length:]
+            # Convert to screen coordinates once for the trail, the body and its label
+            screen_pos = body.screen_position()
+            
+            # Record trail for bodies (one lookup rather than a membership test and an index)
+            trail_points = self.body_trails.get(body)
+            if trail_points is not None:
+                # Add current position to trail (the deque limits the trail length)
+                trail_points.append(screen_pos)
             
             # Draw body
-            body.draw(surface)
+            if body.kind == KIND_ASTEROID:
+                size = body.display_size
+                pending_blits.append((body.get_sprite(), (screen_pos[0] - size, screen_pos[1] - size)))
+            else:
+                if pending_blits:
+                    surface.blits(pending_blits, doreturn=False)
+                    pending_blits.clear()
+                body.draw(surface, screen_pos)
             
             # If the body has a name, display it
-            if body in self.planet_names:
-                x, y = body.position
-                screen_x = int(x + WIDTH // 2)
-                screen_y = int(y + HEIGHT // 2)
+            name = self.planet_names.get(body)
+            if name is not None:
+                screen_x, screen_y = screen_pos
                 
-                # Create a small font for the planet names
-                font = pygame.font.SysFont('Arial', 12)
-                # Render the name with white
-                text = font.render(self.planet_names[body], True, WHITE)
-                
-                # Create a transparent surface for the text
-                label_surface = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-                label_surface.set_alpha(128)
-                label_surface.blit(text, (0, 0))
+                # Names never change, so render each label only the first time it is drawn
+                label_surface = self.name_labels.get(body)
+                if label_surface is None:
+                    # Render the name with white, semi-transparent
+                    label_surface = render_translucent_text(self.name_font, name, WHITE)
+                    self.name_labels[body] = label_surface
                 
                 # Position the text just above the planet
                 text_rect = label_surface.get_rect(center=(screen_x, screen_y - body.display_size - 5))
-                surface.blit(label_surface, text_rect)
+                pending_blits.append((label_surface, text_rect))
+        
+        surface.blits(pending_blits, doreturn=False)
     
-    def calculate_gravity(self, first, second):
-        """Calculate gravitational effect between two bodies."""
+    def update_physics_mode(self, ticks=None):
+        """Pick the alien physics mode once per step, before the pair loop (ticks defaults to the clock now)."""
+        # Every pair in this step sees the same time, and the clock is read once rather than per pair
+        if ticks is None:
+            ticks = pygame.time.get_ticks()
+        self.physics_ticks = ticks
+        
+        # Determine physics mode based on time rather than body pairs
+        # Change modes every few seconds
+        time_seconds = self.physics_ticks / 1000
+        current_mode = int(time_seconds / PHYSICS_MODE_DURATION) % len(PHYSICS_MODE_NAMES)  # Cycle through all 7 modes
+        
+        # Check if mode has changed and log the change
+        if current_mode != self.current_physics_mode:
+            # Log the mode change with the color of the new mode
+            self.add_message(f"Physics mode changed to: {PHYSICS_MODE_NAMES[current_mode]}", PHYSICS_MODE_COLORS[current_mode])
+        
+        # Store the current mode for display
+        self.current_physics_mode = current_mode
+
+        # Per-body accelerations from the previous step are out of date
+        self.alien_accelerations = {}
+    
+    def alien_body_acceleration(self, body):
+        """Return a body's (as first, as second) acceleration in the choreographed and spiral modes.
+        
+        These depend only on the body and the time, not on the other body of the pair, so they
+        are worked out once per body per step and reused for all of its pairs.
+        """
+        accelerations = self.alien_accelerations.get(body)
+        if accelerations is None:
+            if self.current_physics_mode == 4:  # Choreographed orbits
+                # Apply a gentle choreographed movement
+                # Each body follows a pattern around its current position
+                
+                # Time-dependent pattern
+                time_factor = self.physics_ticks / 2000  # Slow rotation
+                
+                # Create a unique pattern factor for this body based on its mass
+                pattern_factor = (hash(str(body.mass)) % 5) / 5  # 0 to 0.8 in steps of 0.2
+                
+                # Calculate pattern movement:
+                # 1. Circle pattern with radius proportional to mass
+                circle_radius = 0.1 * pattern_factor
+                circle_x = circle_radius * math.cos(time_factor + pattern_factor * 2 * math.pi)
+                circle_y = circle_radius * math.sin(time_factor + pattern_factor * 2 * math.pi)
+                
+                # 2. Figure-8 pattern
+                figure8_scale = 0.1 * (1 - pattern_factor)
+                figure8_x = figure8_scale * math.sin(time_factor * 2)
+                figure8_y = figure8_scale * math.sin(time_factor) * math.cos(time_factor)
+                
+                # Combine patterns
+                acc1_x = (circle_x + figure8_x) * TIME_SCALE
+                acc1_y = (circle_y + figure8_y) * TIME_SCALE
+                
+                # As the second body of a pair it follows the same pattern half a turn out of phase.
+                # cos(a + pi) = -cos(a) and sin(a + pi) = -sin(a), so the circle and the x part of
+                # the figure-8 flip sign, while the y part (a product of two flipped terms) doesn't
+                acc2_x = (-circle_x - figure8_x) * TIME_SCALE
+                acc2_y = (-circle_y + figure8_y) * TIME_SCALE
+                
+                accelerations = ((acc1_x, acc1_y), (acc2_x, acc2_y))
+            else:  # Spiral dance
+                # Create spiral-like motion that depends on position
+                current_dist = math.hypot(body.x, body.y)
+                
+                # Unit vector from center - (cos, sin) of the angle from center
+                if current_dist > 0:
+                    center_x = body.x / current_dist
+                    center_y = body.y / current_dist
+                else:
+                    center_x, center_y = 1.0, 0.0
+                
+                # Determine spiral direction based on distance
+                # This creates a pattern of spiraling inward when far out and outward when close in
+                ideal_dist = 200  # A "comfortable" distance from center
+                spiral_strength = 0.08  
+                
+                # Tangential component (creates spiral) - the center direction rotated 90 degrees
+                tangential_x, tangential_y = -center_y, center_x
+                
+                # Radial component (toward or away from center)
+                radial_direction = 1 if current_dist < ideal_dist else -1
+                radial_strength = min(0.05, abs(current_dist - ideal_dist) / 1000)
+                
+                # Combined motion
+                acc1_x = (spiral_strength * tangential_x + 
+                         radial_direction * radial_strength * center_x) * TIME_SCALE
+                acc1_y = (spiral_strength * tangential_y + 
+                         radial_direction * radial_strength * center_y) * TIME_SCALE
+                
+                # The spiral doesn't depend on which body of the pair this is
+                accelerations = ((acc1_x, acc1_y), (acc1_x, acc1_y))
+            self.alien_accelerations[body] = accelerations
+        return accelerations
+    
+    def calculate_gravity(self, first, second, offset=None):
+        """Calculate gravitational effect between two bodies.
+        
+        offset is the (dx, dy, distance) from first to second if the caller already has it.
+        A body that doesn't exert gravity (an asteroid) doesn't move the other body of the pair.
+        """
+        dx, dy, distance = offset or pair_offset(first, second)
         # Skip if the bodies are too close to avoid division by zero
-        distance = first.distance_to(second)
         if distance < 1:
             return
         
-        # Calculate angle before any physics calculations
-        angle = first.angle_to(second)
+        # Direction from first to second as a unit vector - this is (cos(angle), sin(angle))
+        # of the angle between the bodies, without calling atan2/cos/sin
+        dir_x = dx / distance
+        dir_y = dy / distance
         
         # Calculate force based on masses and distance with additional damping
         if self.alien_physics_enabled:
             # ALIEN PHYSICS: Now oscillates between different modes over time
-            
-            # Determine physics mode based on time rather than body pairs
-            # Change modes every few seconds
-            mode_duration = 10  # seconds per mode
-            time_seconds = pygame.time.get_ticks() / 1000
-            current_mode = int(time_seconds / mode_duration) % 7  # Cycle through all 7 modes
-            
-            # Check if mode has changed and log the change
-            if current_mode != self.current_physics_mode:
-                mode_names = [
-                    "Magnetic Ballet",
-                    "Orbital Waltz",
-                    "Vibration Samba",
-                    "Quantum Tango",
-                    "Choreographed Orbits",
-                    "Spiral Dance",
-                    "Rhythmic Pulsation"
-                ]
-                
-                # Add message about mode change with appropriate color
-                mode_colors = [
-                    (255, 100, 100),  # Red for magnetic ballet
-                    (100, 255, 100),  # Green for orbital waltz
-                    (100, 100, 255),  # Blue for vibration samba
-                    (255, 255, 100),  # Yellow for quantum tango
-                    (255, 100, 255),  # Magenta for choreographed orbits
-                    (255, 100, 100),  # Red for spiral dance
-                    (100, 100, 255)   # Blue for rhythmic pulsation
-                ]
-                
-                # Log the mode change with the color of the new mode
-                self.add_message(f"Physics mode changed to: {mode_names[current_mode]}", mode_colors[current_mode])
-            
-            # Store the current mode for display
-            self.current_physics_mode = current_mode
-            
-            # Set physics mode for calculations
-            physics_mode = current_mode
+            # (chosen once per step by update_physics_mode)
+            physics_mode = self.current_physics_mode
             
             if physics_mode == 0:
                 # Magnetic Ballet
@@ -452,16 +812,14 @@ class SolarSystem:
                 else:
                     # Attraction but weaker than normal gravity
                     force = attraction_factor * GRAVITY_STRENGTH * first.mass * second.mass / (distance * distance + DISTANCE_DAMPING)
-                original_angle = angle
                 
             elif physics_mode == 1:
                 # Orbital dance - perpendicular forces create rotation without attraction
                 # Reduced force strength for gentler motion
                 dance_strength = 0.15  # Reduced from default
                 force = dance_strength * GRAVITY_STRENGTH * first.mass * second.mass / (distance * distance + DISTANCE_DAMPING)
-                original_angle = angle
-                # Set angle perpendicular to create pure rotation
-                angle = angle + math.pi / 2
+                # Rotate the direction 90 degrees to create pure rotation
+                dir_x, dir_y = -dir_y, dir_x
                 
             elif physics_mode == 2:
                 # Vibration system - oscillating force based on distance
@@ -470,45 +828,33 @@ class SolarSystem:
                 oscillation_amplitude = 0.2  # Reduced amplitude
                 oscillation = oscillation_amplitude * math.sin(distance * frequency)
                 force = GRAVITY_STRENGTH * first.mass * second.mass * oscillation / (distance + DISTANCE_DAMPING)
-                original_angle = angle
                 
             elif physics_mode == 3:
                 # Quantum tunneling - force jumps between attraction and repulsion
-                # Use positions to create a deterministic but varied pattern
-                position_hash = (hash(str(first.position[0] * 10)) + hash(str(second.position[1] * 10))) % 100
+                # Use positions to create a deterministic but varied pattern - float hashes are
+                # computed from the value itself, so unlike hash(str(...)) they are the same on
+                # every run and need no string conversion
+                position_hash = (hash(first.x * 10) + hash(second.y * 10)) % 100
                 force_sign = 0.15 if position_hash > 50 else -0.15  # Reduced magnitude
                 force = force_sign * GRAVITY_STRENGTH * first.mass * second.mass / (distance * distance + DISTANCE_DAMPING)
-                original_angle = angle
                 
             elif physics_mode == 4:
                 # Choreographed orbits - each body follows a circular pattern
                 # No direct force between bodies, just a tendency to move in circular patterns
                 force = 0  # No direct force
-                original_angle = angle
                 
                 # This will be handled in the acceleration section with more dance-like movements
                 
             elif physics_mode == 5:
                 # Spiral dance - bodies spiral outward and then back inward
-                # Find center of the system as a reference point
-                
-                # Calculate distances from center first
-                first_dist_from_center = math.sqrt(first.position[0]**2 + first.position[1]**2)
-                second_dist_from_center = math.sqrt(second.position[0]**2 + second.position[1]**2)
-                
-                # Calculate spiral force - varies based on distance from center
-                phase_first = (first_dist_from_center / 100) % (2 * math.pi)
-                phase_second = (second_dist_from_center / 100) % (2 * math.pi)
-                
                 # No direct force, we'll apply individual forces in the acceleration section
                 force = 0
-                original_angle = angle
                 
             else:
                 # Rhythmic pulsation - bodies periodically attract and repel based on a shared rhythm
                 # Using the sum of positions to create a shared rhythm
-                position_sum = first.position[0] + first.position[1] + second.position[0] + second.position[1]
-                time_factor = pygame.time.get_ticks() / 1000  # Time in seconds
+                position_sum = first.x + first.y + second.x + second.y
+                time_factor = self.physics_ticks / 1000  # Time in seconds
                 
                 # Create a rhythmic pulsation with period based on position
                 rhythm_period = 2 + (position_sum % 3)  # Period between 2-4 seconds
@@ -517,7 +863,6 @@ class SolarSystem:
                 # Force oscillates between attraction and repulsion
                 force_scale = 0.2 * math.sin(rhythm_phase * 2 * math.pi)  # -0.2 to 0.2
                 force = force_scale * GRAVITY_STRENGTH * first.mass * second.mass / (distance * distance + DISTANCE_DAMPING)
-                original_angle = angle
         else:
             # Normal Newtonian physics (inverse square law)
             force = GRAVITY_STRENGTH * first.mass * second.mass / (distance * distance + DISTANCE_DAMPING)
@@ -534,80 +879,41 @@ class SolarSystem:
         if self.alien_physics_enabled:
             if physics_mode == 0:  # Magnetic field
                 # Standard direction, but force already accounts for attraction/repulsion
-                acc1_x = acc1 * math.cos(angle)
-                acc1_y = acc1 * math.sin(angle)
+                acc1_x = acc1 * dir_x
+                acc1_y = acc1 * dir_y
                 
             elif physics_mode == 1:  # Orbital dance
                 # Pure perpendicular force
-                acc1_x = acc1 * math.cos(angle)
-                acc1_y = acc1 * math.sin(angle)
+                acc1_x = acc1 * dir_x
+                acc1_y = acc1 * dir_y
                 
             elif physics_mode == 2 or physics_mode == 3:  # Vibration or Quantum
                 # Use standard direction, force already has sign
-                acc1_x = acc1 * math.cos(angle)
-                acc1_y = acc1 * math.sin(angle)
+                acc1_x = acc1 * dir_x
+                acc1_y = acc1 * dir_y
                 
             elif physics_mode == 4:  # Choreographed orbits
-                # Apply a gentle choreographed movement
-                # Each body follows a pattern around its current position
-                
-                # Time-dependent pattern
-                time_factor = pygame.time.get_ticks() / 2000  # Slow rotation
-                
-                # Create a unique pattern factor for this body based on its mass
-                pattern_factor = (hash(str(first.mass)) % 5) / 5  # 0 to 0.8 in steps of 0.2
-                
-                # Calculate pattern movement:
-                # 1. Circle pattern with radius proportional to mass
-                circle_radius = 0.1 * pattern_factor
-                circle_x = circle_radius * math.cos(time_factor + pattern_factor * 2 * math.pi)
-                circle_y = circle_radius * math.sin(time_factor + pattern_factor * 2 * math.pi)
-                
-                # 2. Figure-8 pattern
-                figure8_scale = 0.1 * (1 - pattern_factor)
-                figure8_x = figure8_scale * math.sin(time_factor * 2)
-                figure8_y = figure8_scale * math.sin(time_factor) * math.cos(time_factor)
-                
-                # Combine patterns
-                acc1_x = (circle_x + figure8_x) * TIME_SCALE
-                acc1_y = (circle_y + figure8_y) * TIME_SCALE
+                # Same for every pair this body is in, so it is worked out once per step
+                acc1_x, acc1_y = self.alien_body_acceleration(first)[0]
                     
             elif physics_mode == 5:  # Spiral dance
-                # Create spiral-like motion that depends on position
-                current_dist = math.sqrt(first.position[0]**2 + first.position[1]**2)
-                
-                # Angle from center
-                center_angle = math.atan2(first.position[1], first.position[0])
-                
-                # Determine spiral direction based on distance
-                # This creates a pattern of spiraling inward when far out and outward when close in
-                ideal_dist = 200  # A "comfortable" distance from center
-                spiral_strength = 0.08  
-                
-                # Tangential component (creates spiral)
-                tangential_angle = center_angle + math.pi/2
-                
-                # Radial component (toward or away from center)
-                radial_direction = 1 if current_dist < ideal_dist else -1
-                radial_strength = min(0.05, abs(current_dist - ideal_dist) / 1000)
-                
-                # Combined motion
-                acc1_x = (spiral_strength * math.cos(tangential_angle) + 
-                         radial_direction * radial_strength * math.cos(center_angle)) * TIME_SCALE
-                acc1_y = (spiral_strength * math.sin(tangential_angle) + 
-                         radial_direction * radial_strength * math.sin(center_angle)) * TIME_SCALE
+                # Same for every pair this body is in, so it is worked out once per step
+                acc1_x, acc1_y = self.alien_body_acceleration(first)[0]
                 
             else:  # Rhythmic pulsation
                 # Standard direction with force that changes over time
-                acc1_x = acc1 * math.cos(angle)
-                acc1_y = acc1 * math.sin(angle)
+                acc1_x = acc1 * dir_x
+                acc1_y = acc1 * dir_y
         else:
             # Standard direction
-            acc1_x = acc1 * math.cos(angle)
-            acc1_y = acc1 * math.sin(angle)
+            acc1_x = acc1 * dir_x
+            acc1_y = acc1 * dir_y
         
-        vx1, vy1 = first.velocity
-        first.velocity = (vx1 + acc1_x, vy1 + acc1_y)
+        # Bodies that don't exert gravity are test particles in every physics mode, just as
+        # in the normal gravity passes - they are moved by the other body but don't move it
+        if second.exerts_gravity:
+            first.vx += acc1_x
+            first.vy += acc1_y
         
         # Second body (opposite direction for most physics modes)
         acc2 = force / second.mass
@@ -620,79 +926,39 @@ class SolarSystem:
         if self.alien_physics_enabled:
             if physics_mode == 0:  # Magnetic field
                 # Standard opposite direction, force already accounts for sign
-                acc2_x = acc2 * math.cos(angle + math.pi)
-                acc2_y = acc2 * math.sin(angle + math.pi)
+                acc2_x = -acc2 * dir_x
+                acc2_y = -acc2 * dir_y
                 
             elif physics_mode == 1:  # Orbital dance
                 # Perpendicular force in opposite direction
-                acc2_x = acc2 * math.cos(angle + math.pi)
-                acc2_y = acc2 * math.sin(angle + math.pi)
+                acc2_x = -acc2 * dir_x
+                acc2_y = -acc2 * dir_y
                 
             elif physics_mode == 2 or physics_mode == 3:  # Vibration or Quantum
                 # Use standard direction, force already has sign
-                acc2_x = acc2 * math.cos(angle + math.pi)
-                acc2_y = acc2 * math.sin(angle + math.pi)
+                acc2_x = -acc2 * dir_x
+                acc2_y = -acc2 * dir_y
                 
             elif physics_mode == 4:  # Choreographed orbits
-                # Apply a gentle choreographed movement
-                # Similar to first body but with different phase
-                
-                # Time-dependent pattern
-                time_factor = pygame.time.get_ticks() / 2000  # Slow rotation
-                
-                # Create a unique pattern factor for this body based on its mass
-                pattern_factor = (hash(str(second.mass)) % 5) / 5  # 0 to 0.8 in steps of 0.2
-                
-                # Calculate pattern movement with phase shift:
-                # 1. Circle pattern with radius proportional to mass
-                circle_radius = 0.1 * pattern_factor
-                circle_x = circle_radius * math.cos(time_factor + pattern_factor * 2 * math.pi + math.pi)  # Phase shift
-                circle_y = circle_radius * math.sin(time_factor + pattern_factor * 2 * math.pi + math.pi)  # Phase shift
-                
-                # 2. Figure-8 pattern
-                figure8_scale = 0.1 * (1 - pattern_factor)
-                figure8_x = figure8_scale * math.sin(time_factor * 2 + math.pi)
-                figure8_y = figure8_scale * math.sin(time_factor + math.pi) * math.cos(time_factor + math.pi)
-                
-                # Combine patterns
-                acc2_x = (circle_x + figure8_x) * TIME_SCALE
-                acc2_y = (circle_y + figure8_y) * TIME_SCALE
+                # Same for every pair this body is in, so it is worked out once per step
+                acc2_x, acc2_y = self.alien_body_acceleration(second)[1]
                 
             elif physics_mode == 5:  # Spiral dance
-                # Create spiral-like motion, similar to first body but with parameter variations
-                current_dist = math.sqrt(second.position[0]**2 + second.position[1]**2)
-                
-                # Angle from center
-                center_angle = math.atan2(second.position[1], second.position[0])
-                
-                # Determine spiral direction based on distance
-                ideal_dist = 200  # A "comfortable" distance from center
-                spiral_strength = 0.08  
-                
-                # Tangential component (creates spiral)
-                tangential_angle = center_angle + math.pi/2
-                
-                # Radial component (toward or away from center)
-                radial_direction = 1 if current_dist < ideal_dist else -1
-                radial_strength = min(0.05, abs(current_dist - ideal_dist) / 1000)
-                
-                # Combined motion
-                acc2_x = (spiral_strength * math.cos(tangential_angle) + 
-                         radial_direction * radial_strength * math.cos(center_angle)) * TIME_SCALE
-                acc2_y = (spiral_strength * math.sin(tangential_angle) + 
-                         radial_direction * radial_strength * math.sin(center_angle)) * TIME_SCALE
+                # Same for every pair this body is in, so it is worked out once per step
+                acc2_x, acc2_y = self.alien_body_acceleration(second)[1]
                 
             else:  # Rhythmic pulsation
                 # Standard direction with force that changes over time
-                acc2_x = acc2 * math.cos(angle + math.pi)
-                acc2_y = acc2 * math.sin(angle + math.pi)
+                acc2_x = -acc2 * dir_x
+                acc2_y = -acc2 * dir_y
         else:
             # Standard opposite direction
-            acc2_x = acc2 * math.cos(angle + math.pi)
-            acc2_y = acc2 * math.sin(angle + math.pi)
+            acc2_x = -acc2 * dir_x
+            acc2_y = -acc2 * dir_y
         
-        vx2, vy2 = second.velocity
-        second.velocity = (vx2 + acc2_x, vy2 + acc2_y)
+        if first.exerts_gravity:
+            second.vx += acc2_x
+            second.vy += acc2_y
         
         # Apply velocity dampening in alien physics mode to prevent objects from flying away
         if self.alien_physics_enabled:
@@ -700,147 +966,355 @@ class SolarSystem:
             max_velocity = 2.0  # Reduced from 5.0 for tighter containment
             
             # First body velocity limiting
-            v1_magnitude = math.sqrt(first.velocity[0]**2 + first.velocity[1]**2)
+            v1_magnitude = math.hypot(first.vx, first.vy)
             if v1_magnitude > max_velocity:
                 scale_factor = max_velocity / v1_magnitude
-                first.velocity = (first.velocity[0] * scale_factor, first.velocity[1] * scale_factor)
+                first.vx *= scale_factor
+                first.vy *= scale_factor
                 
             # Second body velocity limiting
-            v2_magnitude = math.sqrt(second.velocity[0]**2 + second.velocity[1]**2)
+            v2_magnitude = math.hypot(second.vx, second.vy)
             if v2_magnitude > max_velocity:
                 scale_factor = max_velocity / v2_magnitude
-                second.velocity = (second.velocity[0] * scale_factor, second.velocity[1] * scale_factor)
+                second.vx *= scale_factor
+                second.vy *= scale_factor
                 
             # Apply containment force to keep bodies within a reasonable distance from center
             # This creates a "dance floor" effect where bodies can't stray too far
             containment_radius = 500  # Maximum allowed distance from center
             
             # First body containment
-            first_dist_from_center = math.sqrt(first.position[0]**2 + first.position[1]**2)
+            first_dist_from_center = math.hypot(first.x, first.y)
             if first_dist_from_center > containment_radius:
-                # Calculate angle from center to body
-                angle_to_center = math.atan2(first.position[1], first.position[0])
-                
                 # Apply inward force proportional to how far beyond the boundary
                 beyond_boundary = first_dist_from_center - containment_radius
                 containment_force = min(0.2, beyond_boundary / 100)  # Cap at 0.2 for stability
                 
-                # Add velocity component pointing back toward center
-                vx1, vy1 = first.velocity
-                first.velocity = (
-                    vx1 - containment_force * math.cos(angle_to_center) * TIME_SCALE,
-                    vy1 - containment_force * math.sin(angle_to_center) * TIME_SCALE
-                )
+                # Add velocity component pointing back toward center, along the unit
+                # vector from center to body
+                scale = containment_force / first_dist_from_center * TIME_SCALE
+                first.vx -= first.x * scale
+                first.vy -= first.y * scale
                 
             # Second body containment
-            second_dist_from_center = math.sqrt(second.position[0]**2 + second.position[1]**2)
+            second_dist_from_center = math.hypot(second.x, second.y)
             if second_dist_from_center > containment_radius:
-                # Calculate angle from center to body
-                angle_to_center = math.atan2(second.position[1], second.position[0])
-                
                 # Apply inward force proportional to how far beyond the boundary
                 beyond_boundary = second_dist_from_center - containment_radius
                 containment_force = min(0.2, beyond_boundary / 100)  # Cap at 0.2 for stability
                 
-                # Add velocity component pointing back toward center
-                vx2, vy2 = second.velocity
-                second.velocity = (
-                    vx2 - containment_force * math.cos(angle_to_center) * TIME_SCALE,
-                    vy2 - containment_force * math.sin(angle_to_center) * TIME_SCALE
-                )
-    
-    def check_collision(self, first, second):
-        """Check if two bodies have collided."""
+                # Add velocity component pointing back toward center, along the unit
+                # vector from center to body
+                scale = containment_force / second_dist_from_center * TIME_SCALE
+                second.vx -= second.x * scale
+                second.vy -= second.y * scale
+    
+    def apply_pairwise_gravity(self, bodies):
+        """Apply Newtonian gravity between every pair of bodies in a single pass.
+        
+        Returns the (first, second, distance) pairs that are close enough to collide.
+        """
+        # Copy positions, masses and radii into flat lists once, so the inner loops
+        # index plain lists instead of looking up attributes on body objects
+        xs = [body.x for body in bodies]
+        ys = [body.y for body in bodies]
+        masses = [body.mass for body in bodies]
+        radii = [body.display_size / 2 for body in bodies]
+        count = len(bodies)
+        acc_x = [0.0] * count
+        acc_y = [0.0] * count
+        close_pairs = []
+        sqrt = math.sqrt
+        
+        # Bodies that pull on others, and the test particles (asteroids) that don't
+        sources = [i for i, body in enumerate(bodies) if body.exerts_gravity]
+        tracers = [i for i, body in enumerate(bodies) if not body.exerts_gravity]
+        
+        # Sources attract each other - each pair once, with equal and opposite directions
+        for a, i in enumerate(sources):
+            x1, y1, mass1, radius1 = xs[i], ys[i], masses[i], radii[i]
+            # Accumulate this body's acceleration in locals and store it once per row
+            ax1 = acc_x[i]
+            ay1 = acc_y[i]
+            
+            for j in sources[a + 1:]:
+                dx = xs[j] - x1
+                dy = ys[j] - y1
+                distance_sq = dx*dx + dy*dy
+                
+                # Remember overlapping pairs for the collision check (same test as check_collision)
+                touching = radius1 + radii[j]
+                if distance_sq < touching * touching:
+                    close_pairs.append((i, j, sqrt(distance_sq)))
+                
+                # Skip if the bodies are too close to avoid division by zero
+                if distance_sq < 1:
+                    continue
+                
+                # Acceleration magnitude per unit mass of the other body, limited for stability
+                # like calculate_gravity, then divided by distance so multiplying by (dx, dy)
+                # gives the x/y components without any trigonometry
+                distance = sqrt(distance_sq)
+                strength = GRAVITY_STRENGTH / (distance_sq + DISTANCE_DAMPING)
+                acc1 = min(strength * masses[j], 0.5) / distance
+                acc2 = min(strength * mass1, 0.5) / distance
+                
+                ax1 += acc1 * dx
+                ay1 += acc1 * dy
+                acc_x[j] -= acc2 * dx
+                acc_y[j] -= acc2 * dy
+            
+            acc_x[i] = ax1
+            acc_y[i] = ay1
+        
+        # Test particles are only pulled by the sources, so pairs of them are skipped entirely
+        # (they can't collide with each other either)
+        for i in tracers:
+            x1, y1, radius1 = xs[i], ys[i], radii[i]
+            ax1 = ay1 = 0.0
+            
+            for j in sources:
+                dx = xs[j] - x1
+                dy = ys[j] - y1
+                distance_sq = dx*dx + dy*dy
+                
+                touching = radius1 + radii[j]
+                if distance_sq < touching * touching:
+                    close_pairs.append((min(i, j), max(i, j), sqrt(distance_sq)))
+                
+                if distance_sq < 1:
+                    continue
+                
+                distance = sqrt(distance_sq)
+                acc1 = min(GRAVITY_STRENGTH / (distance_sq + DISTANCE_DAMPING) * masses[j], 0.5) / distance
+                ax1 += acc1 * dx
+                ay1 += acc1 * dy
+            
+            acc_x[i] = ax1
+            acc_y[i] = ay1
+        
+        for body, ax, ay in zip(bodies, acc_x, acc_y):
+            # Apply time scale to acceleration
+            body.vx += ax * TIME_SCALE
+            body.vy += ay * TIME_SCALE
+
+        # Report the pairs in list order, like a single pass over all pairs would
+        close_pairs.sort()
+        return [(bodies[i], bodies[j], distance) for i, j, distance in close_pairs]
+    
+    def apply_array_gravity(self, bodies):
+        """NumPy version of apply_pairwise_gravity, computing all pairs with array operations.
+        
+        Returns the (first, second, distance) pairs that are close enough to collide.
+        """
+        xs = np.array([body.x for body in bodies])
+        ys = np.array([body.y for body in bodies])
+        masses = np.array([body.mass for body in bodies])
+        radii = np.array([body.display_size / 2 for body in bodies])
+        
+        # Only the bodies that pull on others (not the asteroid test particles) are columns
+        exerts = np.array([body.exerts_gravity for body in bodies], dtype=bool)
+        sources = np.nonzero(exerts)[0]
+        
+        # Offsets from each body (row) to each source (column)
+        dx = xs[sources][np.newaxis, :] - xs[:, np.newaxis]
+        dy = ys[sources][np.newaxis, :] - ys[:, np.newaxis]
+        distance_sq = dx*dx + dy*dy
+        
+        # Overlapping pairs for the collision check. Pairs of sources appear twice (and each
+        # source is paired with itself), so those are kept only below the diagonal.
+        touching = radii[:, np.newaxis] + radii[sources][np.newaxis, :]
+        hits = distance_sq < touching * touching
+        hits &= ~exerts[:, np.newaxis] | (np.arange(len(bodies))[:, np.newaxis] < sources[np.newaxis, :])
+        rows, cols = np.nonzero(hits)
+        close_pairs = sorted(
+            (min(i, j), max(i, j), math.sqrt(distance_sq[i, c]))
+            for i, j, c in zip(rows.tolist(), sources[cols].tolist(), cols.tolist())
+        )
+        
+        # Bodies that are too close (including each source and itself) exert no force,
+        # which also avoids division by zero
+        far = distance_sq >= 1
+        distance = np.sqrt(np.where(far, distance_sq, 1.0))
+        
+        # Acceleration of each row body towards each source, limited for stability
+        # like calculate_gravity, then divided by distance so multiplying by (dx, dy)
+        # gives the x/y components
+        acc = np.minimum(GRAVITY_STRENGTH / (distance_sq + DISTANCE_DAMPING) * masses[sources][np.newaxis, :], 0.5)
+        acc *= far
+        acc /= distance
+        
+        # Apply time scale to acceleration
+        acc_x = (acc * dx).sum(axis=1) * TIME_SCALE
+        acc_y = (acc * dy).sum(axis=1) * TIME_SCALE
+        for body, ax, ay in zip(bodies, acc_x.tolist(), acc_y.tolist()):
+            body.vx += ax
+            body.vy += ay
+        
+        return [(bodies[i], bodies[j], distance) for i, j, distance in close_pairs]
+    
+    def apply_tree_gravity(self, bodies):
+        """Apply Newtonian gravity to all bodies using a Barnes-Hut quadtree.
+        
+        Returns the (first, second, distance) pairs that are close enough to collide.
+        """
+        # Only bodies that pull on others go into the tree, but every body is pulled by it
+        sources = [body for body in bodies if body.exerts_gravity]
+        if not sources:
+            return []
+        root = QuadTreeNode.build(sources)
+        
+        # Velocities don't affect the tree, so each body can be updated as soon as it's walked
+        for body in bodies:
+            ax, ay = root.acceleration_on(body, BARNES_HUT_THETA)
+            # Apply time scale to acceleration
+            body.vx += ax * TIME_SCALE
+            body.vy += ay * TIME_SCALE
+        
+        # Use the same tree to find collisions instead of measuring every pair - only
+        # sources within reach of the largest source can touch a body
+        index = {body: i for i, body in enumerate(bodies)}
+        max_radius = max(body.display_size / 2 for body in sources)
+        close_pairs = []
+        for i, body in enumerate(bodies):
+            radius = body.display_size / 2
+            candidates = []
+            root.bodies_near(body.x, body.y, radius + max_radius, candidates)
+            for other in candidates:
+                # Pairs of sources are found from both ends, so keep them only once
+                j = index[other]
+                if body.exerts_gravity and j <= i:
+                    continue
+                dx, dy, distance = pair_offset(body, other)
+                if distance < radius + other.display_size / 2:
+                    close_pairs.append((min(i, j), max(i, j), distance))
+        
+        # Report the pairs in the same order as the pairwise pass
+        close_pairs.sort()
+        return [(bodies[i], bodies[j], distance) for i, j, distance in close_pairs]
+    
+    def check_collision(self, first, second, distance=None):
+        """Check if two bodies have collided.
+        
+        Bodies destroyed by a collision are only marked; call remove_destroyed_bodies() to remove them.
+        """
+        first_kind = first.kind
+        second_kind = second.kind
+        
         # Skip collision check between two planets or two asteroids
-        if (isinstance(first, Planet) and isinstance(second, Planet)) or \
-           (isinstance(first, Asteroid) and isinstance(second, Asteroid)):
+        if first_kind == second_kind and (first_kind == KIND_PLANET or first_kind == KIND_ASTEROID):
             return
         
-        if first.distance_to(second) < first.display_size/2 + second.display_size/2:
+        if distance is None:
+            distance = first.distance_to(second)
+        
+        if distance < first.display_size/2 + second.display_size/2:
             # Get names for better collision messages
             first_name = self.planet_names.get(first, "unnamed")
             second_name = self.planet_names.get(second, "unnamed")
             
             # Handle sun-planet and sun-asteroid collisions
-            if isinstance(first, Sun) and (isinstance(second, Planet) or isinstance(second, Asteroid)):
+            if first_kind == KIND_SUN and (second_kind == KIND_PLANET or second_kind == KIND_ASTEROID):
                 message = f"{first_name} destroyed {second_name}!"
                 self.add_message(message, (255, 200, 0))  # Yellow-orange for sun destruction
-                self.remove_body(second)
-            elif isinstance(second, Sun) and (isinstance(first, Planet) or isinstance(first, Asteroid)):
+                self.destroy_body(second)
+            elif second_kind == KIND_SUN and (first_kind == KIND_PLANET or first_kind == KIND_ASTEROID):
                 message = f"{second_name} destroyed {first_name}!"
                 self.add_message(message, (255, 200, 0))  # Yellow-orange for sun destruction
-                self.remove_body(first)
+                self.destroy_body(first)
             # Handle planet-asteroid collisions (asteroid gets absorbed)
-            elif isinstance(first, Planet) and isinstance(second, Asteroid):
+            elif first_kind == KIND_PLANET and second_kind == KIND_ASTEROID:
                 message = f"Planet {first_name} absorbed asteroid {second_name}!"
                 self.add_message(message, (150, 255, 150))  # Light green for absorption
-                self.remove_body(second)
-            elif isinstance(first, Asteroid) and isinstance(second, Planet):
+                self.destroy_body(second)
+            elif first_kind == KIND_ASTEROID and second_kind == KIND_PLANET:
                 message = f"Planet {second_name} absorbed asteroid {first_name}!"
                 self.add_message(message, (150, 255, 150))  # Light green for absorption
-                self.remove_body(first)
-    
-    def handle_all_interactions(self):
-        """Handle all gravitational interactions and collisions."""
-        # Create a copy to avoid modification during iteration
-        bodies = self.bodies.copy()
-        
-        # First apply gravity between all bodies
-        for i, first in enumerate(bodies):
-            # Skip if body has been removed
-            if first not in self.bodies:
-                continue
-                
-            for second in bodies[i+1:]:
-                # Skip if either body has been removed
-                if second not in self.bodies:
+                self.destroy_body(first)
+    
+    def handle_all_interactions(self, ticks=None):
+        """Handle all gravitational interactions and collisions (ticks is the frame's clock reading)."""
+        # No copy is needed - destroyed bodies are only removed (by building a new list)
+        # after the pair loops, so this list is never modified while it is iterated
+        bodies = self.bodies
+        
+        # Normal physics is computed for all bodies in one pass - exactly for small systems
+        # (vectorized with NumPy when it is installed), or approximated with a Barnes-Hut
+        # quadtree (O(N log N)) when there are many bodies
+        # Each of these passes also finds the pairs that are touching, for the collision check
+        # Destroyed bodies stay in the list until the end of the pass, so they are
+        # skipped with a set lookup instead of an O(N) search of self.bodies
+        destroyed = self.destroyed
+        if not self.alien_physics_enabled:
+            if np is not None and len(bodies) <= ARRAY_GRAVITY_MAX_BODIES:
+                close_pairs = self.apply_array_gravity(bodies)
+            elif sum(1 for body in bodies if body.exerts_gravity) >= BARNES_HUT_MIN_BODIES:
+                close_pairs = self.apply_tree_gravity(bodies)
+            else:
+                close_pairs = self.apply_pairwise_gravity(bodies)
+
+            for first, second, distance in close_pairs:
+                # Skip if either body has been destroyed
+                if first not in destroyed and second not in destroyed:
+                    self.check_collision(first, second, distance)
+        else:
+            # Alien physics is handled pair by pair, together with the collisions
+            self.update_physics_mode(ticks)
+            for i, first in enumerate(bodies):
+                # Skip if body has been destroyed
+                if first in destroyed:
                     continue
                     
-                self.calculate_gravity(first, second)
-                self.check_collision(first, second)
+                for second in bodies[i+1:]:
+                    # Skip if either body has been destroyed
+                    if second in destroyed:
+                        continue
+                    
+                    # Compute the offset once and share it between gravity and collision checks
+                    offset = pair_offset(first, second)
+                    self.calculate_gravity(first, second, offset)
+                    self.check_collision(first, second, offset[2])
+                    
+                    # Stop using this body once it has been destroyed
+                    if first in destroyed:
+                        break
+        
+        self.remove_destroyed_bodies()
         
         # Then apply circular orbit enforcement to maintain stable circular orbits
         if self.enforce_circular_orbit_enabled:
-            sun = None
-            for body in bodies:
-                if isinstance(body, Sun):
-                    sun = body
-                    break
-            
+            sun = self.sun
             if sun:
-                for body in bodies:
-                    if isinstance(body, Planet) and body in self.initial_distances:
-                        # Get the initial distance (ideal orbit)
-                        ideal_distance = self.initial_distances[body]
+                initial_distances = self.initial_distances
+                for body in self.planets:
+                    # Get the initial distance (ideal orbit) with a single lookup
+                    ideal_distance = initial_distances.get(body)
+                    if ideal_distance is not None:
+                        # Get current offset and distance from sun
+                        dx, dy, current_distance = pair_offset(body, sun)
                         
-                        # Get current distance from sun
-                        current_distance = body.distance_to(sun)
-                        
-                        # Skip if distances are close enough
-                        if abs(current_distance - ideal_distance) < 0.5:
+                        # Skip if distances are close enough (or the direction is undefined)
+                        if abs(current_distance - ideal_distance) < 0.5 or current_distance == 0:
                             continue
                         
-                        # Calculate angle to sun
-                        angle_to_sun = body.angle_to(sun)
-                        
                         # Calculate correction force vector direction
                         # If too close, force should push away from sun
                         # If too far, force should pull toward sun
                         if current_distance < ideal_distance:
                             # Push away from sun
-                            correction_angle = angle_to_sun + math.pi
+                            direction = -1.0
                             # Apply stronger correction when too close to prevent collisions
                             correction_strength = abs(current_distance - ideal_distance) * ORBIT_CORRECTION * 2.0
                         else:
                             # Pull toward sun
-                            correction_angle = angle_to_sun
+                            direction = 1.0
                             correction_strength = abs(current_distance - ideal_distance) * ORBIT_CORRECTION
                         
-                        # Apply correction force to velocity
-                        vx, vy = body.velocity
-                        vx += correction_strength * math.cos(correction_angle) * TIME_SCALE
-                        vy += correction_strength * math.sin(correction_angle) * TIME_SCALE
-                        body.velocity = (vx, vy)
+                        # Apply correction force to velocity along the unit vector to the sun,
+                        # which is (cos, sin) of the angle to the sun without any trigonometry
+                        scale = direction * correction_strength / current_distance * TIME_SCALE
+                        body.vx += dx * scale
+                        body.vy += dy * scale
 
     def add_message(self, message, color=None):
         """Add a message to the log with an optional color."""
@@ -857,7 +1331,8 @@ class SolarSystem:
         
         # Trim log if it gets too long
         if len(self.message_log) > self.max_log_messages:
-            self.message_log.pop(0)  # Remove oldest message
+            removed = self.message_log.pop(0)  # Remove oldest message
+            self.message_labels.pop(removed, None)
         
         # Also print to console for debugging
         print(f"LOG: {timestamped_message}")
@@ -869,14 +1344,10 @@ class SolarSystem:
         
         # Display a header for the log section if there are any messages
         if self.message_log:
-            # Create text with transparency
-            log_header = font.render("Event Log:", True, (200, 200, 200))
-            # Create a surface with per-pixel alpha
-            header_surface = pygame.Surface(log_header.get_size(), pygame.SRCALPHA)
-            # Set transparency (128 = semi-transparent)
-            header_surface.set_alpha(128)
-            # Blit the text onto the transparent surface
-            header_surface.blit(log_header, (0, 0))
+            # The header and messages never change once added, so each is rendered only
+            # the first time it is displayed (messages are dropped from message_labels
+            # again when they leave the log)
+            header_surface = render_label(font, "Event Log:", (200, 200, 200))
             # Blit the transparent surface onto the main surface
             surface.blit(header_surface, (start_x, header_y))
             
@@ -884,15 +1355,13 @@ class SolarSystem:
             message_y = header_y + 25
             
             # Display each message with its color
-            for message, color in self.message_log:
-                # Create text with the specified color
-                message_display = font.render(message, True, color)
-                # Create a surface with per-pixel alpha
-                message_surface = pygame.Surface(message_display.get_size(), pygame.SRCALPHA)
-                # Set transparency (128 = semi-transparent)
-                message_surface.set_alpha(128)
-                # Blit the text onto the transparent surface
-                message_surface.blit(message_display, (0, 0))
+            for entry in self.message_log:
+                message_surface = self.message_labels.get(entry)
+                if message_surface is None:
+                    message, color = entry
+                    # Create semi-transparent text with the specified color
+                    message_surface = render_translucent_text(font, message, color)
+                    self.message_labels[entry] = message_surface
                 # Blit the transparent surface onto the main surface
                 surface.blit(message_surface, (start_x, message_y))
                 message_y += 20  # Spacing between messages
@@ -901,26 +1370,27 @@ def add_random_planet(solar_system, pos):
     """Add a planet at the given position with appropriate velocity and a random name."""
     x, y = pos
     # Convert to coordinates relative to center
-    x -= WIDTH // 2
-    y -= HEIGHT // 2
+    x -= CX
+    y -= CY
     
     # Calculate distance from center
-    distance = math.sqrt(x*x + y*y)
+    distance = math.hypot(x, y)
     
     # Enforce minimum distance from sun
     if distance < 70:  # Reduced from 100 to match new scale
-        # Too close to center - place it at minimum distance in same direction
-        angle = math.atan2(y, x)
+        # Too close to center - place it at minimum distance in same direction,
+        # by scaling the (x, y) vector rather than going through its angle
+        if distance > 0:
+            scale = 70 / distance
+            x *= scale
+            y *= scale
+        else:
+            # Clicked exactly on the center, so there is no direction - use +x
+            x, y = 70, 0
         distance = 70
-        x = math.cos(angle) * distance
-        y = math.sin(angle) * distance
     
     # Find the sun to calculate appropriate orbital velocity
-    sun = None
-    for body in solar_system.bodies:
-        if isinstance(body, Sun):
-            sun = body
-            break
+    sun = solar_system.sun
     
     if sun:
         # Calculate velocity based on Kepler's laws for a circular orbit
@@ -964,16 +1434,19 @@ def add_random_planet(solar_system, pos):
 def add_elliptical_asteroid(solar_system, min_distance, max_distance, eccentricity=None):
     """Add an asteroid with an elliptical orbit between min and max distance from the sun."""
     # Find the sun
-    sun = None
-    for body in solar_system.bodies:
-        if isinstance(body, Sun):
-            sun = body
-            break
+    sun = solar_system.sun
     
     if not sun:
         print("Cannot add asteroid: No sun found in the solar system")
         return
     
+    # At the limit, make room by removing the oldest asteroid (the deque is oldest first)
+    if len(solar_system.asteroids) >= MAX_ASTEROIDS:
+        oldest = solar_system.asteroids[0]
+        oldest_name = solar_system.planet_names.get(oldest, "unnamed")
+        solar_system.remove_body(oldest, "replaced")
+        solar_system.add_message(f"Asteroid limit reached: {oldest_name} replaced", (200, 200, 200))
+    
     # Random distance within the specified range
     distance = random.uniform(min_distance, max_distance)
     
@@ -1038,46 +1511,27 @@ def main():
     # Maintain the same relative distances between planets but reduce absolute distances
     
     # Define planet data for our solar system with improved spacing
-    # Format: name, distance from sun, mass, color, size_scale, has_rings
+    # Format: name, distance from sun, mass, color, size_scale, has_rings, angle
     # Using a more logarithmic scale for distances to better represent the solar system
+    # Planets are distributed evenly around the sun (45 degrees apart) rather than at random
+    # positions, which creates a more balanced system and better visualization
     planets_data = [
-        # Name       Distance  Mass    Color           Size Scale  Rings
-        ("Mercury",  80,       0.055,  MERCURY_COLOR,  0.38,       False),
-        ("Venus",    120,      0.815,  VENUS_COLOR,    0.95,       False),
-        ("Earth",    160,      1.0,    EARTH_COLOR,    1.0,        False),
-        ("Mars",     200,      0.107,  MARS_COLOR,     0.53,       False),
-        ("Jupiter",  280,      317.8,  JUPITER_COLOR,  11.2,       False),
-        ("Saturn",   350,      95.2,   SATURN_COLOR,   9.45,       True),
-        ("Uranus",   420,      14.6,   URANUS_COLOR,   4.0,        False),
-        ("Neptune",  480,      17.2,   NEPTUNE_COLOR,  3.88,       False)
+        # Name       Distance  Mass    Color           Size Scale  Rings   Angle
+        ("Mercury",  80,       0.055,  MERCURY_COLOR,  0.38,       False,  0),                # 0 degrees
+        ("Venus",    120,      0.815,  VENUS_COLOR,    0.95,       False,  math.pi / 4),      # 45 degrees
+        ("Earth",    160,      1.0,    EARTH_COLOR,    1.0,        False,  math.pi / 2),      # 90 degrees
+        ("Mars",     200,      0.107,  MARS_COLOR,     0.53,       False,  3 * math.pi / 4),  # 135 degrees
+        ("Jupiter",  280,      317.8,  JUPITER_COLOR,  11.2,       False,  math.pi),          # 180 degrees
+        ("Saturn",   350,      95.2,   SATURN_COLOR,   9.45,       True,   5 * math.pi / 4),  # 225 degrees
+        ("Uranus",   420,      14.6,   URANUS_COLOR,   4.0,        False,  3 * math.pi / 2),  # 270 degrees
+        ("Neptune",  480,      17.2,   NEPTUNE_COLOR,  3.88,       False,  7 * math.pi / 4)   # 315 degrees
     ]
     
     # Base size for Earth - everything else will be relative to this
     base_earth_size = 8
     
     # Add the planets
-    for name, distance, relative_mass, color, size_scale, has_rings in planets_data:
-        # Distribute planets evenly around the sun rather than random positions
-        # This creates a more balanced system and better visualization
-        if name == "Mercury":
-            angle = 0
-        elif name == "Venus":
-            angle = math.pi / 4  # 45 degrees
-        elif name == "Earth":
-            angle = math.pi / 2  # 90 degrees
-        elif name == "Mars":
-            angle = 3 * math.pi / 4  # 135 degrees
-        elif name == "Jupiter":
-            angle = math.pi  # 180 degrees
-        elif name == "Saturn":
-            angle = 5 * math.pi / 4  # 225 degrees
-        elif name == "Uranus":
-            angle = 3 * math.pi / 2  # 270 degrees
-        elif name == "Neptune":
-            angle = 7 * math.pi / 4  # 315 degrees
-        else:
-            angle = random.uniform(0, 2 * math.pi)
-            
+    for name, distance, relative_mass, color, size_scale, has_rings, angle in planets_data:
         x = math.cos(angle) * distance
         y = math.sin(angle) * distance
         
@@ -1156,11 +1610,39 @@ def main():
     # Global for time scale
     global TIME_SCALE
     
+    # Instructions (split into two lines) never change, so render them once
+    text_surface1 = render_label(font, "Click: Add planet | ESC: Quit | O: Toggle orbits | C: Toggle circular orbit enforcement", (200, 200, 200))
+    text_surface2 = render_label(font, "P: Toggle alien physics | A: Add asteroid | +/-: Change speed | S: Reset speed | T: Toggle trails", (200, 200, 200))
+    
+    # Rendered countdowns for the current alien physics mode, indexed by the tenths of a
+    # second remaining - at most 101 labels, as the table is emptied whenever the mode changes
+    countdown_steps = PHYSICS_MODE_DURATION * 10 + 1  # 0.0s to 10.0s remaining inclusive (101 values)
+    countdown_labels = [None] * countdown_steps
+    countdown_mode = None
+    
+    # The HUD's labels and their positions, which are only laid out again when the state
+    # it shows changes (None forces the first frame to lay them out)
+    hud_blits = []
+    last_hud_state = None
+    
+    # The speed can take almost any value, so only the label for the current one is kept
+    speed_label_text = None
+    speed_surface = None
+    
+    # Render the alien physics mode labels up front too, so a mode change doesn't have to
+    render_label(font, "Alien physics oscillates between modes every 10 seconds", (150, 150, 150))
+    for mode_name, mode_color in zip(PHYSICS_MODE_NAMES, PHYSICS_MODE_COLORS):
+        render_label(font, f"Current Mode: {mode_name}", mode_color)
+        render_label(font, f"Next Mode: {mode_name}", (180, 180, 180))
+    
     # Main loop
     running = True
     while running:
         screen.fill(BLACK)
         
+        # Read the clock once per frame, for both the alien physics and the HUD
+        frame_ticks = pygame.time.get_ticks()
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -1204,7 +1686,6 @@ def main():
                         TIME_SCALE *= 2.0   # Double the speed for high speeds
                     
                     solar_system.add_message(f"Speed increased to {TIME_SCALE:.2f}x", (255, 255, 255))
-                    print(f"Speed: {TIME_SCALE:.2f}x")
                 elif event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
                     # Decrease speed - use appropriate scaling based on current speed
                     if TIME_SCALE > 10.0:
@@ -1218,11 +1699,9 @@ def main():
                     TIME_SCALE = max(TIME_SCALE, 0.01)
                     
                     solar_system.add_message(f"Speed decreased to {TIME_SCALE:.2f}x", (255, 255, 255))
-                    print(f"Speed: {TIME_SCALE:.2f}x")
                 elif event.key == pygame.K_s:  # 'S' key to reset speed to normal
                     TIME_SCALE = 1.0
                     solar_system.add_message("Speed reset to 1.00x (normal)", (255, 255, 255))
-                    print(f"Speed reset to {TIME_SCALE:.2f}x (normal)")
                 elif event.key == pygame.K_a:  # 'A' key to add random asteroid
                     # Add a random asteroid with elliptical orbit
                     min_distance = 120  # Min distance from sun
@@ -1233,142 +1712,111 @@ def main():
                     add_random_planet(solar_system, event.pos)
         
         # Calculate physics
-        solar_system.handle_all_interactions()
+        solar_system.handle_all_interactions(frame_ticks)
         
         # Update and draw
         solar_system.update_all(screen)
         
-        # Draw instructions (split into two lines)
-        instruction_text1 = font.render("Click: Add planet | ESC: Quit | O: Toggle orbits | C: Toggle circular orbit enforcement", True, (200, 200, 200))
-        instruction_text2 = font.render("P: Toggle alien physics | A: Add asteroid | +/-: Change speed | S: Reset speed | T: Toggle trails", True, (200, 200, 200))
-        
-        # Create transparent surfaces
-        text_surface1 = pygame.Surface(instruction_text1.get_size(), pygame.SRCALPHA)
-        text_surface1.set_alpha(128)
-        text_surface1.blit(instruction_text1, (0, 0))
-        
-        text_surface2 = pygame.Surface(instruction_text2.get_size(), pygame.SRCALPHA)
-        text_surface2.set_alpha(128)
-        text_surface2.blit(instruction_text2, (0, 0))
-        
-        # Blit the transparent surfaces
-        screen.blit(text_surface1, (10, 10))
-        screen.blit(text_surface2, (10, 35))
-        
         # Display current speed with appropriate formatting for large values
-        speed_text = ""
+        speed_text = f"Speed: {TIME_SCALE:.2f}x"
         if TIME_SCALE < 5:
-            speed_text = f"Speed: {TIME_SCALE:.2f}x"
             speed_color = (255, 255, 255)
         elif TIME_SCALE < 10:
-            speed_text = f"Speed: {TIME_SCALE:.2f}x"
             speed_color = (255, 150, 0)
         else:
-            speed_text = f"Speed: {TIME_SCALE:.2f}x"
             speed_color = (255, 50, 50)
         
-        # Create transparent speed display
-        speed_display = font.render(speed_text, True, speed_color)
-        speed_surface = pygame.Surface(speed_display.get_size(), pygame.SRCALPHA)
-        speed_surface.set_alpha(128)
-        speed_surface.blit(speed_display, (0, 0))
-        screen.blit(speed_surface, (10, 60))
-        
-        # Display circular orbit enforcement status
-        enforce_circular_orbit_text = f"Circular Orbit Enforcement: {'On' if solar_system.enforce_circular_orbit_enabled else 'Off'}"
-        enforce_circular_orbit_color = (0, 255, 0) if solar_system.enforce_circular_orbit_enabled else (255, 50, 50)
-        
-        # Create transparent circular orbit enforcement display
-        enforce_circular_orbit_display = font.render(enforce_circular_orbit_text, True, enforce_circular_orbit_color)
-        orbit_surface = pygame.Surface(enforce_circular_orbit_display.get_size(), pygame.SRCALPHA)
-        orbit_surface.set_alpha(128)
-        orbit_surface.blit(enforce_circular_orbit_display, (0, 0))
-        screen.blit(orbit_surface, (10, 85))
-        
-        # Display orbit trails status
-        trails_text = f"Orbit Trails: {'On' if solar_system.show_trails else 'Off'}"
-        trails_color = (0, 255, 0) if solar_system.show_trails else (255, 50, 50)
-        
-        # Create transparent trails display
-        trails_display = font.render(trails_text, True, trails_color)
-        trails_surface = pygame.Surface(trails_display.get_size(), pygame.SRCALPHA)
-        trails_surface.set_alpha(128)
-        trails_surface.blit(trails_display, (0, 0))
-        screen.blit(trails_surface, (10, 110))
-        
-        # Display alien physics status
-        alien_text = f"Alien Physics: {'On' if solar_system.alien_physics_enabled else 'Off'}"
-        alien_color = (180, 100, 255) if solar_system.alien_physics_enabled else (255, 50, 50)
-        
-        # Create transparent alien physics display
-        alien_display = font.render(alien_text, True, alien_color)
-        alien_surface = pygame.Surface(alien_display.get_size(), pygame.SRCALPHA)
-        alien_surface.set_alpha(128)
-        alien_surface.blit(alien_display, (0, 0))
-        screen.blit(alien_surface, (10, 135))
-        
-        # Display active physics modes if alien physics is enabled
+        # Calculate time remaining in the current alien physics mode (shown to a tenth of a second)
+        # Worked out in whole milliseconds, so no string is formatted unless a label is rendered
+        remaining_tenths = None
         if solar_system.alien_physics_enabled:
-            # Add explanation of alien physics
-            explanation_text = "Alien physics oscillates between modes every 10 seconds"
-            explanation_display = font.render(explanation_text, True, (150, 150, 150))
-            explanation_surface = pygame.Surface(explanation_display.get_size(), pygame.SRCALPHA)
-            explanation_surface.set_alpha(128)
-            explanation_surface.blit(explanation_display, (0, 0))
-            screen.blit(explanation_surface, (10, 180))
+            mode_duration_ms = PHYSICS_MODE_DURATION * 1000
+            time_remaining_ms = mode_duration_ms - frame_ticks % mode_duration_ms
+            remaining_tenths = (time_remaining_ms + 50) // 100  # Rounded to the nearest tenth
             
-            mode_names = [
-                "Magnetic Ballet",
-                "Orbital Waltz",
-                "Vibration Samba",
-                "Quantum Tango",
-                "Choreographed Orbits",
-                "Spiral Dance",
-                "Rhythmic Pulsation"
-            ]
+        # The HUD only changes on a key press or when the mode countdown ticks over, so its
+        # labels are only looked up and positioned when that state changes
+        hud_state = (speed_text, solar_system.enforce_circular_orbit_enabled, solar_system.show_trails,
+                     solar_system.alien_physics_enabled, solar_system.current_physics_mode, remaining_tenths)
+        if hud_state != last_hud_state:
+            last_hud_state = hud_state
+            hud_blits.clear()
             
-            # Display currently active mode
-            current_mode = solar_system.current_physics_mode
-            current_mode_name = mode_names[current_mode]
+            # Draw instructions (rendered once before the loop)
+            hud_blits.append((text_surface1, (10, 10)))
+            hud_blits.append((text_surface2, (10, 35)))
             
-            # Calculate time remaining in current mode
-            mode_duration = 10  # seconds (must match the value in calculate_gravity)
-            time_seconds = pygame.time.get_ticks() / 1000
-            time_in_current_mode = time_seconds % mode_duration
-            time_remaining = mode_duration - time_in_current_mode
+            # Create transparent speed display, rendering it again only when the speed changes
+            if speed_text != speed_label_text:
+                speed_label_text = speed_text
+                speed_surface = render_translucent_text(font, speed_text, speed_color)
+            hud_blits.append((speed_surface, (10, 60)))
             
-            # Display current mode with time remaining
-            mode_colors = [
-                (255, 100, 100),  # Red for magnetic ballet
-                (100, 255, 100),  # Green for orbital waltz
-                (100, 100, 255),  # Blue for vibration samba
-                (255, 255, 100),  # Yellow for quantum tango
-                (255, 100, 255),  # Magenta for choreographed orbits
-                (255, 100, 100),  # Red for spiral dance
-                (100, 100, 255)   # Blue for rhythmic pulsation
-            ]
+            # Display circular orbit enforcement status - the statuses only change on a key
+            # press and each has two possible labels, so render_label renders them once
+            enforce_circular_orbit_text = ENFORCE_CIRCULAR_ORBIT_TEXTS[solar_system.enforce_circular_orbit_enabled]
+            enforce_circular_orbit_color = (0, 255, 0) if solar_system.enforce_circular_orbit_enabled else (255, 50, 50)
             
-            mode_text = f"Current Mode: {current_mode_name} ({time_remaining:.1f}s remaining)"
-            mode_color = mode_colors[current_mode]
+            # Create transparent circular orbit enforcement display
+            orbit_surface = render_label(font, enforce_circular_orbit_text, enforce_circular_orbit_color)
+            hud_blits.append((orbit_surface, (10, 85)))
             
-            # Create transparent mode display
-            mode_display = font.render(mode_text, True, mode_color)
-            mode_surface = pygame.Surface(mode_display.get_size(), pygame.SRCALPHA)
-            mode_surface.set_alpha(128)
-            mode_surface.blit(mode_display, (0, 0))
-            screen.blit(mode_surface, (10, 205))  # Adjust position
+            # Display orbit trails status
+            trails_text = TRAILS_TEXTS[solar_system.show_trails]
+            trails_color = (0, 255, 0) if solar_system.show_trails else (255, 50, 50)
             
-            # Display next mode
-            next_mode = (current_mode + 1) % 7
-            next_mode_name = mode_names[next_mode]
-            next_mode_text = f"Next Mode: {next_mode_name}"
+            # Create transparent trails display
+            trails_surface = render_label(font, trails_text, trails_color)
+            hud_blits.append((trails_surface, (10, 110)))
             
-            # Create transparent next mode display
-            next_mode_display = font.render(next_mode_text, True, (180, 180, 180))
-            next_mode_surface = pygame.Surface(next_mode_display.get_size(), pygame.SRCALPHA)
-            next_mode_surface.set_alpha(128)
-            next_mode_surface.blit(next_mode_display, (0, 0))
-            screen.blit(next_mode_surface, (10, 235))  # Adjust position
+            # Display alien physics status
+            alien_text = ALIEN_PHYSICS_TEXTS[solar_system.alien_physics_enabled]
+            alien_color = (180, 100, 255) if solar_system.alien_physics_enabled else (255, 50, 50)
+            
+            # Create transparent alien physics display
+            alien_surface = render_label(font, alien_text, alien_color)
+            hud_blits.append((alien_surface, (10, 135)))
+            
+            # Display active physics modes if alien physics is enabled
+            if solar_system.alien_physics_enabled:
+                # Add explanation of alien physics
+                explanation_text = "Alien physics oscillates between modes every 10 seconds"
+                explanation_surface = render_label(font, explanation_text, (150, 150, 150))
+                hud_blits.append((explanation_surface, (10, 180)))
+                
+                # Display currently active mode
+                current_mode = solar_system.current_physics_mode
+                current_mode_name = PHYSICS_MODE_NAMES[current_mode]
+                
+                # Display current mode with time remaining - the mode label comes from the labels
+                # rendered before the loop, and only the countdown after it is rendered here
+                mode_color = PHYSICS_MODE_COLORS[current_mode]
+                mode_surface = render_label(font, f"Current Mode: {current_mode_name}", mode_color)
+                hud_blits.append((mode_surface, (10, 205)))  # Adjust position
+                
+                # Create transparent time remaining display, just right of the mode label.
+                # Each value is rendered once per mode and reused whenever it comes round again
+                if current_mode != countdown_mode:
+                    countdown_labels = [None] * countdown_steps
+                    countdown_mode = current_mode
+                remaining_surface = countdown_labels[remaining_tenths]
+                if remaining_surface is None:
+                    remaining_text = f" ({remaining_tenths / 10:.1f}s remaining)"
+                    remaining_surface = render_translucent_text(font, remaining_text, mode_color)
+                    countdown_labels[remaining_tenths] = remaining_surface
+                hud_blits.append((remaining_surface, (10 + mode_surface.get_width(), 205)))
+                
+                # Display next mode
+                next_mode = NEXT_PHYSICS_MODES[current_mode]
+                next_mode_name = PHYSICS_MODE_NAMES[next_mode]
+                next_mode_text = f"Next Mode: {next_mode_name}"
+                
+                # Create transparent next mode display
+                next_mode_surface = render_label(font, next_mode_text, (180, 180, 180))
+                hud_blits.append((next_mode_surface, (10, 235)))  # Adjust position
+        
+        # Draw the HUD (instructions, speed, statuses and alien physics modes) in one call
+        screen.blits(hud_blits, doreturn=False)
         
         # Display message log in the bottom left corner
         solar_system.display_message_log(screen, font, 10, HEIGHT - 150)